@@ -67,7 +67,8 @@ class Evolution:
         """
         return self._add_step(CheckpointStep(name=name, target=target, method=method, every=every))
 
-    def map(self, func: Callable[..., Individual], name: Optional[str] = None, **kwargs) -> 'Evolution':
+    def map(self, func: Callable[..., Individual], name: Optional[str] = None, *, threads: Optional[int] = 1,
+            **kwargs) -> 'Evolution':
         """Add a map step to the Evolution.
 
         This applies the provided function to each individual in the
@@ -75,10 +76,12 @@ class Evolution:
 
         :param func: Function to apply to the individuals in the population.
         :param name: Name of the map step.
+        :param threads: If > 1, apply the function in {threads} threads. This only
+            speeds up functions that release the GIL. Defaults to 1.
         :param kwargs: Arguments to pass to the function.
         :return: This Evolution with an additional step.
         """
-        return self._add_step(MapStep(name=name, func=func, **kwargs))
+        return self._add_step(MapStep(name=name, func=func, threads=threads, **kwargs))
 
     def filter(self, func: Callable[..., bool], name: Optional[str] = None, **kwargs) -> 'Evolution':
         """Add a filter step to the Evolution.
@@ -124,6 +127,8 @@ class Evolution:
               combiner: Callable,
               population_size: Optional[int] = None,
               name: Optional[str] = None,
+              *,
+              vectorized: bool = False,
               **kwargs) -> 'Evolution':
         """Add a breed step to the Evolution.
 
@@ -137,18 +142,24 @@ class Evolution:
             If None, take the previous intended population size.
             Defaults to None.
         :param name: Name of the breed step.
+        :param vectorized: If True, the combiner is called once with a list containing
+            a tuple of parent chromosomes for each missing individual, and must return
+            a list with one child chromosome per tuple. Defaults to False.
         :param kwargs: Kwargs to pass to the parent_picker and combiner.
             Arguments are only passed to the functions if they accept them.
         :return: self
         """
         return self._add_step(BreedStep(name=name, parent_picker=parent_picker, combiner=combiner,
-                                        population_size=population_size, **kwargs))
+                                        population_size=population_size, vectorized=vectorized, **kwargs))
 
     def mutate(self,
                mutate_function: Callable[..., Any],
                probability: float = 1.0,
                elitist: bool = False,
                name: Optional[str] = None,
+               *,
+               vectorized: bool = False,
+               threads: Optional[int] = 1,
                **kwargs) -> 'Evolution':
         """Add a mutate step to the Evolution.
 
@@ -164,12 +175,18 @@ class Evolution:
             individual will be treated as normal.
             Defaults to False.
         :param name: Name of the mutate step.
+        :param vectorized: If True, the mutate_function is called once with a list
+            of all chromosomes that mutate, and must return a list of the mutated
+            chromosomes in the same order. Defaults to False.
+        :param threads: If > 1, mutate the chromosomes in {threads} threads. This only
+            speeds up mutate functions that release the GIL. Defaults to 1.
         :param kwargs: Kwargs to pass to the parent_picker and combiner.
             Arguments are only passed to the functions if they accept them.
         :return: self
         """
         return self._add_step(MutateStep(name=name, probability=probability, elitist=elitist,
-                                         mutate_function=mutate_function, **kwargs))
+                                         vectorized=vectorized, threads=threads, mutate_function=mutate_function,
+                                         **kwargs))
 
     def repeat(self, evolution: 'Evolution', n: int = 1, name: Optional[str] = None,
                grouping_function: Optional[Callable] = None, **kwargs) -> 'Evolution':
@@ -5,6 +5,7 @@ separate the fitness calculation from the data structure. This
 saves a lot of CPU power.
 """
 
+from copyreg import _slotnames
 from random import random
 from typing import Any, Callable, Optional
 from uuid import uuid4
@@ -17,6 +18,9 @@ class Individual:
     :param fitness: The fitness of the individual, or None.
         Defaults to None.
     """
+    # Slots make individuals smaller and their attributes faster to access.
+    # Subclasses that do not define __slots__ can still have other attributes.
+    __slots__ = ('age', 'chromosome', 'fitness', 'id')
 
     def __init__(self, chromosome: Any, fitness: Optional[float] = None):
         self.age = 0
@@ -24,6 +28,23 @@ class Individual:
         self.fitness = fitness
         self.id = f"{str(uuid4())[:6]}"
 
+    def __copy__(self):
+        result = self.__class__.__new__(self.__class__)
+        result.__setstate__(self.__getstate__())
+        return result
+
+    def __getstate__(self):
+        # The same state as pickle protocol 2 and up would store, which includes the slots of subclasses
+        slots = {name: getattr(self, name) for name in _slotnames(self.__class__) if hasattr(self, name)}
+        return getattr(self, '__dict__', None), slots
+
+    def __setstate__(self, state):
+        # Individuals pickled before slots were introduced only have a dictionary as state
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **state[1]}
+        for key, value in state.items():
+            setattr(self, key, value)
+
     def __repr__(self):
         return f"<individual id:{self.id} fitness:{self.fitness}>"
 
@@ -39,6 +60,15 @@ class Individual:
         result.id = data['id']
         return result
 
+    def to_dict(self) -> dict:
+        """Store the Individual in a dictionary, which can be loaded with from_dict.
+
+        :return: Dictionary containing the keys 'age', 'chromosome', 'fitness' and 'id',
+            and any other attributes of the Individual.
+        """
+        attributes, slots = self.__getstate__()
+        return {**slots, **(attributes or {})}
+
     def __post_evaluate(self, result):
         self.fitness = result
 
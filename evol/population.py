@@ -5,26 +5,55 @@ evolutionary steps by directly calling methods on the population
 or by applying an `evol.Evolution` object.
 """
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict, defaultdict
 from copy import copy
-from itertools import cycle, islice
+from functools import lru_cache, partial
+from heapq import nlargest, nsmallest
+from itertools import accumulate, chain, compress, islice, repeat
 from math import ceil
-from random import choices, randint
-from typing import Any, Callable, Generator, Iterable, Iterator, List, Optional, Sequence, TYPE_CHECKING
+from operator import add, attrgetter, is_, sub
+from random import choices
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
 from uuid import uuid4
 
-from multiprocess.pool import Pool
+from multiprocess import cpu_count
+from multiprocess.pool import Pool, ThreadPool
 
 from evol import Individual
 from evol.conditions import Condition
 from evol.exceptions import StopEvolution
 from evol.helpers.groups import group_random
-from evol.utils import offspring_generator, select_arguments
+from evol.utils import batch_offspring, chromosome_key, offspring_generator, sample_indices, select_arguments
 from evol.serialization import SimpleSerializer
 
 if TYPE_CHECKING:
     from .evolution import Evolution
 
 
+@lru_cache(maxsize=8)
+def _shared_pool(concurrent_workers: Optional[int]) -> Pool:
+    """Get a pool of workers that is shared between all populations with the same number of workers."""
+    return Pool(concurrent_workers)
+
+
+@lru_cache(maxsize=8)
+def _shared_thread_pool(threads: Optional[int]) -> ThreadPool:
+    """Get a pool of threads that is shared between all populations with the same number of threads."""
+    return ThreadPool(threads)
+
+
+def _thread_map(func: Callable, iterable: Sequence, threads: Optional[int] = 1) -> List:
+    """Apply a function to every item, in a pool of threads if threads is not 1."""
+    if threads == 1:
+        return list(map(func, iterable))
+    return _shared_thread_pool(threads).map(func, iterable)
+
+
+def _call_unpacked(func: Callable, args: Sequence) -> Any:
+    """Call a function with the arguments unpacked, which can be pickled when partially applied unlike a lambda."""
+    return func(*args)
+
+
 class BasePopulation(metaclass=ABCMeta):
 
     def __init__(self,
@@ -35,7 +64,8 @@ class BasePopulation(metaclass=ABCMeta):
                  maximize: bool = True,
                  generation: int = 0,
                  intended_size: Optional[int] = None,
-                 serializer=None):
+                 serializer=None,
+                 map_function: Optional[Callable[[Callable, Iterable], Iterable]] = None):
         self.concurrent_workers = concurrent_workers
         self.documented_best = None
         self.eval_function = eval_function
@@ -43,9 +73,40 @@ class BasePopulation(metaclass=ABCMeta):
         self.id = str(uuid4())[:6]
         self.individuals = [Individual(chromosome=chromosome) for chromosome in chromosomes]
         self.intended_size = intended_size or len(self.individuals)
+        self.map_function = map_function
         self.maximize = maximize
         self.serializer = serializer or SimpleSerializer(target=checkpoint_target)
-        self.pool = None if concurrent_workers == 1 else Pool(concurrent_workers)
+        self._pool: Optional[Pool] = None
+        self._pool_workers = concurrent_workers
+
+    def __copy__(self):
+        return self._copy(self.individuals)
+
+    def _copy(self, individuals: Iterable[Individual]) -> 'BasePopulation':
+        """Copy this population, but with copies of the given individuals."""
+        # Bypass __init__: the copy shares the serializer, pool and id of this
+        # population, and its individuals keep their fitness.
+        result = object.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
+        result.individuals = [copy(individual) for individual in individuals]
+        return result
+
+    @property
+    def pool(self) -> Optional[Pool]:
+        """The pool used to evaluate in parallel, which is only created once it is needed.
+
+        This is None if a map_function is provided, as that is used instead.
+        """
+        if self.map_function is not None:
+            return None
+        if self._pool is None and self._pool_workers != 1:
+            self._pool = _shared_pool(self._pool_workers)
+        return self._pool
+
+    @pool.setter
+    def pool(self, pool: Optional[Pool]):
+        self._pool = pool
+        self._pool_workers = 1  # An explicitly set pool (or None) is never replaced
 
     def __iter__(self) -> Iterator[Individual]:
         return self.individuals.__iter__()
@@ -61,24 +122,19 @@ class BasePopulation(metaclass=ABCMeta):
 
     @property
     def current_best(self) -> Individual:
-        evaluated_individuals = tuple(filter(lambda x: x.fitness is not None, self.individuals))
-        if len(evaluated_individuals) > 0:
-            return max(evaluated_individuals, key=lambda x: x.fitness if self.maximize else -x.fitness)
+        return self._extreme(best=True)
 
     @property
     def current_worst(self) -> Individual:
-        evaluated_individuals = tuple(filter(lambda x: x.fitness is not None, self.individuals))
-        if len(evaluated_individuals) > 0:
-            return min(evaluated_individuals, key=lambda x: x.fitness if self.maximize else -x.fitness)
+        return self._extreme(best=False)
 
     @property
-    def chromosomes(self) -> Generator[Any, None, None]:
-        for individual in self.individuals:
-            yield individual.chromosome
+    def chromosomes(self) -> Iterator[Any]:
+        return map(attrgetter('chromosome'), self.individuals)
 
     @property
     def is_evaluated(self) -> bool:
-        return all(individual.fitness is not None for individual in self)
+        return not any(map(partial(is_, None), map(attrgetter('fitness'), self.individuals)))
 
     @classmethod
     def generate(cls,
@@ -124,19 +180,35 @@ class BasePopulation(metaclass=ABCMeta):
         self.serializer.checkpoint(individuals=self.individuals, target=target, method=method)
         return self
 
-    @property
-    def _individual_weights(self):
+    def _fitness_range(self) -> Tuple[List[float], float, float]:
+        """Get the fitnesses of all individuals, and the minimum and maximum fitness."""
+        fitnesses = list(map(attrgetter('fitness'), self.individuals))
         try:
-            min_fitness = min(individual.fitness for individual in self)
-            max_fitness = max(individual.fitness for individual in self)
+            return fitnesses, min(fitnesses), max(fitnesses)
         except TypeError:
             raise RuntimeError('Individual weights can not be computed if the individuals are not evaluated.')
+
+    @property
+    def _individual_weights(self):
+        fitnesses, min_fitness, max_fitness = self._fitness_range()
+        if min_fitness == max_fitness:
+            return [1] * len(fitnesses)
+        span = max_fitness - min_fitness
+        if self.maximize:
+            return [(fitness - min_fitness) / span for fitness in fitnesses]
+        else:
+            return [(max_fitness - fitness) / span for fitness in fitnesses]
+
+    @property
+    def _individual_cum_weights(self) -> Optional[List[float]]:
+        """Cumulative weights proportional to the individual weights, or None if all weights are equal."""
+        fitnesses, min_fitness, max_fitness = self._fitness_range()
         if min_fitness == max_fitness:
-            return [1] * len(self)
-        elif self.maximize:
-            return [(individual.fitness - min_fitness) / (max_fitness - min_fitness) for individual in self]
+            return None
+        if self.maximize:
+            return list(accumulate(map(sub, fitnesses, repeat(min_fitness))))
         else:
-            return [1 - (individual.fitness - min_fitness) / (max_fitness - min_fitness) for individual in self]
+            return list(accumulate(map(sub, repeat(max_fitness), fitnesses)))
 
     def evolve(self, evolution: 'Evolution', n: int = 1) -> 'BasePopulation':  # noqa: F821
         """Evolve the population according to an Evolution.
@@ -163,6 +235,8 @@ class BasePopulation(metaclass=ABCMeta):
               parent_picker: Callable[..., Sequence[Individual]],
               combiner: Callable,
               population_size: Optional[int] = None,
+              *,
+              vectorized: bool = False,
               **kwargs) -> 'BasePopulation':
         """Create new individuals by combining existing individuals.
 
@@ -175,24 +249,41 @@ class BasePopulation(metaclass=ABCMeta):
         :param population_size: Intended population size after breeding.
             If None, take the previous intended population size.
             Defaults to None.
+        :param vectorized: If True, the combiner is called once with a list containing
+            a tuple of parent chromosomes for each missing individual, and must return
+            a list with one child chromosome per tuple. This allows creating all
+            children at once, e.g. with NumPy or a JIT-compiled function.
+            Defaults to False.
         :param kwargs: Kwargs to pass to the parent_picker and combiner.
             Arguments are only passed to the functions if they accept them.
         :return: self
         """
         if population_size:
             self.intended_size = population_size
-        offspring = offspring_generator(parents=self.individuals,
-                                        parent_picker=select_arguments(parent_picker),
-                                        combiner=select_arguments(combiner),
-                                        **kwargs)
-        self.individuals += list(islice(offspring, self.intended_size - len(self.individuals)))
+        if vectorized:
+            self.individuals += batch_offspring(parents=self.individuals,
+                                                parent_picker=select_arguments(parent_picker),
+                                                combiner=select_arguments(combiner),
+                                                n=max(0, self.intended_size - len(self.individuals)),
+                                                **kwargs)
+        else:
+            offspring = offspring_generator(parents=self.individuals,
+                                            parent_picker=select_arguments(parent_picker),
+                                            combiner=select_arguments(combiner),
+                                            **kwargs)
+            # Create all children before adding them, so that they are not picked as parents
+            self.individuals += list(islice(offspring, self.intended_size - len(self.individuals)))
         self.generation += 1
         return self
 
     def mutate(self,
                mutate_function: Callable[..., Any],
                probability: float = 1.0,
-               elitist: bool = False, **kwargs) -> 'BasePopulation':
+               elitist: bool = False,
+               *,
+               vectorized: bool = False,
+               threads: Optional[int] = 1,
+               **kwargs) -> 'BasePopulation':
         """Mutate the chromosome of each individual.
 
         :param mutate_function: Function that accepts a chromosome and returns
@@ -204,24 +295,42 @@ class BasePopulation(metaclass=ABCMeta):
             Note that this only applies to evaluated individuals. Any unevaluated
             individual will be treated as normal.
             Defaults to False.
+        :param vectorized: If True, the mutate_function is called once with a list
+            of all chromosomes that mutate, and must return a list of the mutated
+            chromosomes in the same order. This allows mutating all chromosomes at
+            once, e.g. with NumPy or a JIT-compiled function. Defaults to False.
+        :param threads: If > 1, mutate the chromosomes in {threads} threads. This only
+            speeds up mutate functions that release the GIL, such as NumPy operations.
+            If None, threads is set to n_cpus. Ignored if vectorized. Defaults to 1.
         :param kwargs: Arguments to pass to the mutation function.
         :return: self
         """
         elite_fitness: Optional[float] = self.current_best.fitness if elitist else None
-        for individual in self.individuals:
-            if elite_fitness is None or individual.fitness != elite_fitness:
-                individual.mutate(mutate_function, probability=probability, **kwargs)
+        individuals = self.individuals
+        mutants = [individuals[index] for index in sample_indices(len(individuals), probability=probability)
+                   if elite_fitness is None or individuals[index].fitness != elite_fitness]
+        mutate = partial(mutate_function, **kwargs) if kwargs else mutate_function
+        if vectorized:
+            chromosomes = mutate([individual.chromosome for individual in mutants])
+        else:
+            chromosomes = _thread_map(mutate, [individual.chromosome for individual in mutants], threads=threads)
+        for individual, chromosome in zip(mutants, chromosomes):
+            individual.chromosome = chromosome
+            individual.fitness = None
         return self
 
-    def map(self, func: Callable[..., Individual], **kwargs) -> 'BasePopulation':
+    def map(self, func: Callable[..., Individual], *, threads: Optional[int] = 1, **kwargs) -> 'BasePopulation':
         """Apply the provided function to each individual in the population.
 
         :param func: A function to apply to each individual in the population,
             which when called returns a modified individual.
+        :param threads: If > 1, apply the function in {threads} threads. This only
+            speeds up functions that release the GIL, such as NumPy operations.
+            If None, threads is set to n_cpus. Defaults to 1.
         :param kwargs: Arguments to pass to the function.
         :return: self
         """
-        self.individuals = [func(individual, **kwargs) for individual in self.individuals]
+        self.individuals = _thread_map(partial(func, **kwargs) if kwargs else func, self.individuals, threads=threads)
         return self
 
     def filter(self, func: Callable[..., bool], **kwargs) -> 'BasePopulation':
@@ -234,7 +343,8 @@ class BasePopulation(metaclass=ABCMeta):
         :param kwargs: Arguments to pass to the function.
         :return: self
         """
-        self.individuals = [individual for individual in self.individuals if func(individual, **kwargs)]
+        predicate = partial(func, **kwargs) if kwargs else func
+        self.individuals = list(compress(self.individuals, map(predicate, self.individuals)))
         return self
 
     def survive(self, fraction: Optional[float] = None,
@@ -252,25 +362,33 @@ class BasePopulation(metaclass=ABCMeta):
             with chances proportional to their fitness. Defaults to False.
         :return: self
         """
+        size = len(self.individuals)
         if fraction is None:
             if n is None:
                 raise ValueError('everyone survives! must provide either "fraction" and/or "n".')
             resulting_size = n
         elif n is None:
-            resulting_size = round(fraction * len(self.individuals))
+            resulting_size = round(fraction * size)
         else:
-            resulting_size = min(round(fraction * len(self.individuals)), n)
+            resulting_size = min(round(fraction * size), n)
         self.evaluate(lazy=True)
         if resulting_size == 0:
-            raise RuntimeError(f'No individual out of {len(self.individuals)} survived!')
-        if resulting_size > len(self.individuals):
+            raise RuntimeError(f'No individual out of {size} survived!')
+        if resulting_size > size:
             raise ValueError(f'everyone survives in population {self.id}: '
-                             f'{resulting_size} out of {len(self.individuals)} must survive.')
+                             f'{resulting_size} out of {size} must survive.')
         if luck:
-            self.individuals = choices(self.individuals, k=resulting_size, weights=self._individual_weights)
+            cum_weights = self._individual_cum_weights
+            if cum_weights is None:
+                # All weights are equal, so an unweighted draw is equivalent and skips the bisection
+                self.individuals = choices(self.individuals, k=resulting_size)
+            else:
+                self.individuals = choices(self.individuals, k=resulting_size, cum_weights=cum_weights)
+        elif resulting_size == 1:
+            self.individuals = [(max if self.maximize else min)(self.individuals, key=attrgetter('fitness'))]
         else:
-            sorted_individuals = sorted(self.individuals, key=lambda x: x.fitness, reverse=self.maximize)
-            self.individuals = sorted_individuals[:resulting_size]
+            select = nlargest if self.maximize else nsmallest
+            self.individuals = select(resulting_size, self.individuals, key=attrgetter('fitness'))
         return self
 
     def callback(self, callback_function: Callable[..., None],
@@ -331,8 +449,7 @@ class BasePopulation(metaclass=ABCMeta):
         if len(populations) == 0:
             raise ValueError('Cannot combine zero islands into one.')
         result = copy(populations[0])
-        for pop in populations[1:]:
-            result.individuals += pop.individuals
+        result.individuals.extend(chain.from_iterable(pop.individuals for pop in populations[1:]))
         result.intended_size = intended_size or sum([pop.intended_size for pop in populations])
         result.pool = pool
         result.id = result.id.split('-')[0]
@@ -342,19 +459,39 @@ class BasePopulation(metaclass=ABCMeta):
         """Create a new population that is a subset of this population."""
         if len(index) == 0:
             raise ValueError('Grouping yielded an empty island.')
-        result = copy(self)
-        result.individuals = [result.individuals[i] for i in index]
+        # Only copy the individuals in the subset, an individual in multiple subsets is copied for each
+        result = self._copy(self.individuals[i] for i in index)
         result.intended_size = len(result.individuals)
         result.pool = None  # Subsets shouldn't parallelize anything
         result.id += '-' + subset_id
         return result
 
+    def _map(self, func: Callable, iterable: Sequence, chunksize: Optional[int] = None) -> Iterable:
+        """Apply a function to every item using the map_function, the pool, or sequentially."""
+        if self.map_function is not None:
+            return self.map_function(func, iterable)
+        if self.pool:
+            return self.pool.map(func, iterable, chunksize=chunksize)
+        return map(func, iterable)
+
+    def _extreme(self, best: bool) -> Optional[Individual]:
+        """Find the best or worst evaluated individual in a single pass, or None if none is evaluated."""
+        if self.is_evaluated:  # Usually the case, which makes filtering superfluous
+            evaluated_individuals = self.individuals
+        else:
+            evaluated_individuals = (individual for individual in self.individuals if individual.fitness is not None)
+        return (max if best == self.maximize else min)(evaluated_individuals, default=None, key=attrgetter('fitness'))
+
     def _update_documented_best(self):
         """Update the documented best"""
         current_best = self.current_best
-        if (self.documented_best is None or
-                (self.maximize and current_best.fitness > self.documented_best.fitness) or
-                (not self.maximize and current_best.fitness < self.documented_best.fitness)):
+        if current_best is None:
+            return
+        if self.documented_best is None:
+            self.documented_best = copy(current_best)
+            return
+        current_fitness, documented_fitness = current_best.fitness, self.documented_best.fitness
+        if current_fitness > documented_fitness if self.maximize else current_fitness < documented_fitness:
             self.documented_best = copy(current_best)
 
 
@@ -376,6 +513,24 @@ class Population(BasePopulation):
         SimpleSerializer is created. Defaults to None.
     :param concurrent_workers: If > 1, evaluate individuals in {concurrent_workers}
         separate processes. If None, concurrent_workers is set to n_cpus. Defaults to 1.
+    :param map_function: Function with the signature of the builtin map that is used
+        to evaluate the chromosomes, for instance the map method of an executor from
+        concurrent.futures. If provided, concurrent_workers is ignored and no pool is
+        used, also not to evolve groups in parallel. Defaults to None.
+    :param cache_size: If > 0, remember the fitness of up to {cache_size} recently
+        evaluated chromosomes, and reuse it instead of calling the eval_function again
+        for the same chromosome. Only use this if the eval_function is deterministic.
+        Chromosomes without a cache_key are always evaluated.
+        The cache is shared with copies of the Population. Defaults to 0.
+    :param vectorized: If True, the eval_function is called once with a list of all
+        chromosomes to evaluate, and must return a list of their fitness values in the
+        same order. This allows evaluating all chromosomes at once, e.g. with NumPy.
+        The concurrent_workers and map_function are not used. Defaults to False.
+    :param cache_key: Function that reduces a chromosome to a hashable key under which
+        its fitness is cached, or to None if it should not be cached. Chromosomes with
+        equal keys must have the same fitness. Defaults to evol.utils.chromosome_key,
+        which keys builtin values, lists and arrays by their value, but not instances
+        of custom classes.
     """
 
     def __init__(self,
@@ -386,7 +541,11 @@ class Population(BasePopulation):
                  intended_size: Optional[int] = None,
                  checkpoint_target: Optional[str] = None,
                  serializer=None,
-                 concurrent_workers: Optional[int] = 1):
+                 concurrent_workers: Optional[int] = 1,
+                 map_function: Optional[Callable[[Callable, Iterable], Iterable]] = None,
+                 cache_size: int = 0,
+                 vectorized: bool = False,
+                 cache_key: Callable[[Any], Optional[Hashable]] = chromosome_key):
         super().__init__(chromosomes=chromosomes,
                          eval_function=eval_function,
                          checkpoint_target=checkpoint_target,
@@ -394,22 +553,12 @@ class Population(BasePopulation):
                          maximize=maximize,
                          generation=generation,
                          intended_size=intended_size,
-                         serializer=serializer)
-
-    def __copy__(self):
-        result = self.__class__(chromosomes=[],
-                                eval_function=self.eval_function,
-                                maximize=self.maximize,
-                                serializer=self.serializer,
-                                intended_size=self.intended_size,
-                                generation=self.generation,
-                                concurrent_workers=1)  # Prevent new pool from being made
-        result.individuals = [copy(individual) for individual in self.individuals]
-        result.concurrent_workers = self.concurrent_workers
-        result.pool = self.pool
-        result.documented_best = self.documented_best
-        result.id = self.id
-        return result
+                         serializer=serializer,
+                         map_function=map_function)
+        self.cache_size = cache_size
+        self._fitness_cache = OrderedDict()
+        self.vectorized = vectorized
+        self.cache_key = cache_key
 
     def evaluate(self, lazy: bool = False) -> 'Population':
         """Evaluate the individuals in the population.
@@ -423,17 +572,59 @@ class Population(BasePopulation):
         :param lazy: If True, do no re-evaluate the fitness if the fitness is known.
         :return: self
         """
-        if self.pool:
-            f = self.eval_function  # We cannot refer to self in the map
-            scores = self.pool.map(lambda i: i.fitness if (i.fitness and lazy) else f(i.chromosome), self.individuals)
-            for individual, fitness in zip(self.individuals, scores):
-                individual.fitness = fitness
+        pending = [individual for individual in self.individuals if individual.fitness is None or not lazy]
+        if self.cache_size > 0:
+            self._evaluate_cached(pending)
         else:
-            for individual in self.individuals:
-                individual.evaluate(eval_function=self.eval_function, lazy=lazy)
+            scores = self._evaluate_chromosomes([individual.chromosome for individual in pending])
+            for individual, fitness in zip(pending, scores):
+                individual.fitness = fitness
         self._update_documented_best()
         return self
 
+    def _evaluate_chromosomes(self, chromosomes: List) -> Iterable[float]:
+        """Compute the fitness of each chromosome, in a single call if the eval_function is vectorized."""
+        if not self.vectorized:
+            return self._map(self.eval_function, chromosomes)
+        return self.eval_function(chromosomes) if chromosomes else []
+
+    def clear_cache(self) -> 'Population':
+        """Forget all cached fitness values, e.g. after changing the eval_function.
+
+        As the cache is shared with copies of the Population, this clears it for those too.
+
+        :return: self
+        """
+        self._fitness_cache.clear()
+        return self
+
+    def _evaluate_cached(self, individuals: List[Individual]):
+        """Evaluate individuals, looking up the fitness of known chromosomes in the cache."""
+        cache = self._fitness_cache
+        misses = defaultdict(list)
+        uncached = []
+        for individual in individuals:
+            key = self.cache_key(individual.chromosome)
+            if key is None:
+                uncached.append(individual)
+            elif key in cache:
+                cache.move_to_end(key)
+                individual.fitness = cache[key]
+            else:
+                misses[key].append(individual)
+        # Chromosomes that occur multiple times are evaluated only once, those without a key are always evaluated
+        chromosomes = [group[0].chromosome for group in misses.values()]
+        chromosomes.extend(individual.chromosome for individual in uncached)
+        scores = iter(self._evaluate_chromosomes(chromosomes))
+        for (key, group), fitness in zip(misses.items(), scores):
+            for individual in group:
+                individual.fitness = fitness
+            cache[key] = fitness
+        for individual, fitness in zip(uncached, scores):
+            individual.fitness = fitness
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
 
 class Contest:
     """A single contest among a group of competitors.
@@ -445,6 +636,7 @@ class Contest:
 
     :param competitors: Iterable of Individuals in this Contest.
     """
+    __slots__ = ('competitors',)
 
     def __init__(self, competitors: Iterable[Individual]):
         self.competitors = list(competitors)
@@ -470,15 +662,30 @@ class Contest:
         :return: List of Contests
         """
         contests = []
-        n_rounds = ceil(contests_per_round / individuals_per_contest)
-        for _ in range(n_rounds):
-            offsets = [0] + [randint(0, len(individuals) - 1) for _ in range(individuals_per_contest - 1)]
-            generators = [islice(cycle(individuals), offset, None) for offset in offsets]
-            for competitors in islice(zip(*generators), len(individuals)):
-                contests.append(Contest(competitors))
+        for offsets in _contest_offsets(n_individuals=len(individuals), individuals_per_contest=individuals_per_contest,
+                                        contests_per_round=contests_per_round):
+            contests.extend(map(cls, zip(*(_rotate(individuals, offset) for offset in offsets))))
         return contests
 
 
+def _contest_offsets(n_individuals: int, individuals_per_contest: int, contests_per_round: int) -> List[List[int]]:
+    """Draw the offsets that determine the contests for a round of evaluations.
+
+    In every round, contest j is held between the individuals at index
+    (j + offset) % n_individuals for each of the offsets of that round.
+
+    :return: List with the offsets of each round.
+    """
+    n_rounds = ceil(contests_per_round / individuals_per_contest)
+    indices = range(n_individuals)
+    return [[0, *choices(indices, k=individuals_per_contest - 1)] for _ in range(n_rounds)]
+
+
+def _rotate(items: Sequence, offset: int) -> Sequence:
+    """_rotate([1, 2, 3, 4], 1) -> [2, 3, 4, 1]"""
+    return items[offset:] + items[:offset]
+
+
 class ContestPopulation(BasePopulation):
     """Population which is evaluated through contests.
 
@@ -517,6 +724,10 @@ class ContestPopulation(BasePopulation):
         SimpleSerializer is created. Defaults to None.
     :param concurrent_workers: If > 1, evaluate individuals in {concurrent_workers}
         separate processes. If None, concurrent_workers is set to n_cpus. Defaults to 1.
+    :param map_function: Function with the signature of the builtin map that is used
+        to evaluate the chromosomes, for instance the map method of an executor from
+        concurrent.futures. If provided, concurrent_workers is ignored and no pool is
+        used, also not to evolve groups in parallel. Defaults to None.
     """
     eval_function: Callable[..., Sequence[float]]  # This population expects a different eval signature
 
@@ -530,7 +741,8 @@ class ContestPopulation(BasePopulation):
                  intended_size: Optional[int] = None,
                  checkpoint_target: Optional[int] = None,
                  serializer=None,
-                 concurrent_workers: Optional[int] = 1):
+                 concurrent_workers: Optional[int] = 1,
+                 map_function: Optional[Callable[[Callable, Iterable], Iterable]] = None):
         super().__init__(chromosomes=chromosomes,
                          eval_function=eval_function,
                          maximize=maximize,
@@ -538,25 +750,14 @@ class ContestPopulation(BasePopulation):
                          intended_size=intended_size,
                          checkpoint_target=checkpoint_target,
                          serializer=serializer,
-                         concurrent_workers=concurrent_workers)
+                         concurrent_workers=concurrent_workers,
+                         map_function=map_function)
         self.contests_per_round = contests_per_round
         self.individuals_per_contest = individuals_per_contest
 
-    def __copy__(self):
-        result = self.__class__(chromosomes=[],
-                                eval_function=self.eval_function,
-                                maximize=self.maximize,
-                                contests_per_round=self.contests_per_round,
-                                individuals_per_contest=self.individuals_per_contest,
-                                serializer=self.serializer,
-                                intended_size=self.intended_size,
-                                generation=self.generation,
-                                concurrent_workers=1)
-        result.individuals = [copy(individual) for individual in self.individuals]
-        result.pool = self.pool
-        result.concurrent_workers = self.concurrent_workers
+    def _copy(self, individuals: Iterable[Individual]) -> 'ContestPopulation':
+        result = BasePopulation._copy(self, individuals)
         result.documented_best = None
-        result.id = self.id
         return result
 
     def evaluate(self,
@@ -594,33 +795,41 @@ class ContestPopulation(BasePopulation):
             contests_per_round = self.contests_per_round
         if individuals_per_contest is None:
             individuals_per_contest = self.individuals_per_contest
-        if lazy and all(individual.fitness is not None for individual in self):
+        if lazy and self.is_evaluated:
             return self
-        for individual in self.individuals:
-            individual.fitness = 0
-        contests = Contest.generate(individuals=self.individuals, individuals_per_contest=individuals_per_contest,
-                                    contests_per_round=contests_per_round)
-        if self.pool is None:
-            for contest in contests:
-                contest.assign_scores(self.eval_function(*contest.competitor_chromosomes))
-        else:
-            f = self.eval_function  # We cannot refer to self in the map
-            results = self.pool.map(lambda c: f(*c.competitor_chromosomes), contests)
-            for result, contest in zip(results, contests):
-                contest.assign_scores(result)
+        rounds = _contest_offsets(n_individuals=len(self.individuals), individuals_per_contest=individuals_per_contest,
+                                  contests_per_round=contests_per_round)
+        # Only send the chromosomes to the workers, not the individuals
+        chromosomes = list(self.chromosomes)
+        payloads = [competitors for offsets in rounds
+                    for competitors in zip(*(_rotate(chromosomes, offset) for offset in offsets))]
+        chunksize = max(1, len(payloads) // (4 * (self.concurrent_workers or cpu_count()))) if self.pool else None
+        results = list(self._map(partial(_call_unpacked, self.eval_function), payloads, chunksize=chunksize))
+        # Each column of scores is rotated back to line up with the individuals, and summed
+        n_individuals = len(self.individuals)
+        fitnesses = [0] * n_individuals
+        for i, offsets in enumerate(rounds):
+            round_results = results[i * n_individuals:(i + 1) * n_individuals]
+            for offset, scores in zip(offsets, zip(*round_results)):
+                fitnesses = list(map(add, fitnesses, _rotate(scores, -offset)))
+        for individual, fitness in zip(self.individuals, fitnesses):
+            individual.fitness = fitness
         return self
 
-    def map(self, func: Callable[..., Individual], **kwargs) -> 'ContestPopulation':
+    def map(self, func: Callable[..., Individual], *, threads: Optional[int] = 1, **kwargs) -> 'ContestPopulation':
         """Apply the provided function to each individual in the population.
 
         Resets the fitness of all individuals.
 
         :param func: A function to apply to each individual in the population,
             which when called returns a modified individual.
+        :param threads: If > 1, apply the function in {threads} threads. This only
+            speeds up functions that release the GIL, such as NumPy operations.
+            If None, threads is set to n_cpus. Defaults to 1.
         :param kwargs: Arguments to pass to the function.
         :return: self
         """
-        BasePopulation.map(self, func=func, **kwargs)
+        BasePopulation.map(self, func=func, threads=threads, **kwargs)
         self.reset_fitness()
         return self
 
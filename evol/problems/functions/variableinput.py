@@ -1,7 +1,7 @@
 import math
+from operator import mul
 from typing import Sequence
 
-from evol.helpers.utils import sliding_window
 from evol.problems.problem import Problem
 
 
@@ -30,7 +30,7 @@ class Sphere(FunctionProblem):
         :param solution: a sequence of x_i values
         :return: the value of the Sphere function
         """
-        return sum([_**2 for _ in solution])
+        return sum(map(mul, solution, solution))
 
 
 class Rosenbrock(FunctionProblem):
@@ -40,10 +40,7 @@ class Rosenbrock(FunctionProblem):
         :param solution: a sequence of x_i values
         :return: the value of the Rosenbrock function
         """
-        result = 0
-        for x_i, x_j in sliding_window(solution):
-            result += 100*(x_j - x_i**2)**2 + (1 - x_i)**2
-        return result
+        return sum([100*(x_j - x_i*x_i)**2 + (1 - x_i)**2 for x_i, x_j in zip(solution, solution[1:])])
 
 
 class Rastrigin(FunctionProblem):
@@ -53,4 +50,5 @@ class Rastrigin(FunctionProblem):
         :param solution: a sequence of x_i values
         :return: the value of the Rosenbrock function
         """
-        return (10 * self.size) + sum([_**2 - 10 * math.cos(2*math.pi*_) for _ in solution])
+        cos, tau = math.cos, math.tau
+        return (10 * self.size) + sum([_*_ - 10 * cos(tau*_) for _ in solution])
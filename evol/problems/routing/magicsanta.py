@@ -3,7 +3,6 @@ from collections import Counter
 from itertools import chain
 from typing import List, Union
 
-from evol.helpers.utils import sliding_window
 from evol.problems.problem import Problem
 
 
@@ -23,10 +22,12 @@ class MagicSanta(Problem):
         if gift_weight is None:
             self.gift_weight = [1 for _ in city_coordinates]
         self.sleigh_weight = sleigh_weight
+        # Every route starts and ends at home, so these distances are needed in every evaluation
+        self.home_distances = [self.distance(home_coordinate, coordinate) for coordinate in city_coordinates]
 
     @staticmethod
     def distance(coord_a, coord_b):
-        return math.sqrt(sum([(z[0] - z[1]) ** 2 for z in zip(coord_a, coord_b)]))
+        return math.sqrt(sum([(a - b) ** 2 for a, b in zip(coord_a, coord_b)]))
 
     def check_solution(self, solution: List[List[int]]):
         """
@@ -34,13 +35,13 @@ class MagicSanta(Problem):
         :param solution: List of lists containing integers representing visited cities.
         :return: None, unless errors are raised.
         """
-        set_visited = set(chain.from_iterable(solution))
+        city_counter = Counter(chain.from_iterable(solution))
+        set_visited = set(city_counter)
         set_problem = set(range(len(self.coordinates)))
         if set_visited != set_problem:
             missing = set_problem.difference(set_visited)
             extra = set_visited.difference(set_problem)
             raise ValueError(f"Not all cities are visited! Missing: {missing} Extra: {extra}")
-        city_counter = Counter(chain.from_iterable(solution))
         if max(city_counter.values()) > 1:
             double_cities = {key for key, value in city_counter.items() if value > 1}
             raise ValueError(f"Multiple occurrences found for cities: {double_cities}")
@@ -52,16 +53,14 @@ class MagicSanta(Problem):
         :return:
         """
         self.check_solution(solution=solution)
+        coordinates, gift_weight, home_distances = self.coordinates, self.gift_weight, self.home_distances
+        distance, sleigh_weight = self.distance, self.sleigh_weight
         cost = 0
         for route in solution:
-            total_route_weight = sum([self.gift_weight[t] for t in route]) + self.sleigh_weight
-            distance = self.distance(self.home_coordinate, self.coordinates[route[0]])
-            cost += distance * total_route_weight
-            for t1, t2 in sliding_window(route):
-                total_route_weight -= self.gift_weight[t1]
-                city1 = self.coordinates[t1]
-                city2 = self.coordinates[t2]
-                cost += self.distance(city1, city2) * total_route_weight
-            last_leg_distance = self.distance(self.coordinates[route[-1]], self.home_coordinate)
-            cost += self.sleigh_weight * last_leg_distance
+            total_route_weight = sum(map(gift_weight.__getitem__, route)) + sleigh_weight
+            cost += home_distances[route[0]] * total_route_weight
+            for t1, t2 in zip(route, route[1:]):
+                total_route_weight -= gift_weight[t1]
+                cost += distance(coordinates[t1], coordinates[t2]) * total_route_weight
+            cost += sleigh_weight * home_distances[route[-1]]
         return cost
@@ -1,8 +1,10 @@
 import math
+from array import array
+from itertools import chain
+from operator import getitem
 from typing import List, Union
 
 from evol.problems.problem import Problem
-from evol.helpers.utils import rotating_window
 
 
 class TSPProblem(Problem):
@@ -14,14 +16,11 @@ class TSPProblem(Problem):
         """
         Creates a distance matrix from a list of city coordinates.
         :param coordinates: An iterable that contains tuples or lists representing a x,y coordinate.
-        :return: A list of lists containing the distances between cities.
+        :return: A TSPProblem whose distance matrix has a row of doubles (`array('d')`) per city.
         """
-        res = [[0 for i in coordinates] for j in coordinates]
-        for i, coord_i in enumerate(coordinates):
-            for j, coord_j in enumerate(coordinates):
-                dist = math.sqrt(sum([(z[0] - z[1])**2 for z in zip(coord_i[:2], coord_j[:2])]))
-                res[i][j] = dist
-                res[j][i] = dist
+        points = [(coordinate[0], coordinate[1]) for coordinate in coordinates]
+        hypot = math.hypot
+        res = [array('d', [hypot(x_i - x_j, y_i - y_j) for x_j, y_j in points]) for x_i, y_i in points]
         return TSPProblem(distance_matrix=res)
 
     def check_solution(self, solution: List[int]):
@@ -44,7 +43,6 @@ class TSPProblem(Problem):
         :return:
         """
         self.check_solution(solution=solution)
-        cost = 0
-        for t1, t2 in rotating_window(solution):
-            cost += self.distance_matrix[t1][t2]
-        return cost
+        # Same edges, in the same order, as rotating_window(solution): (last, first), (first, second), ...
+        rows = map(self.distance_matrix.__getitem__, chain(solution[-1:], solution[:-1]))
+        return sum(map(getitem, rows, solution))
@@ -41,7 +41,7 @@ class SimpleSerializer:
                 pickle.dump(individuals, pickle_file)
         elif method == 'json':
             with open(filename, 'w') as json_file:
-                json.dump([individual.__dict__ for individual in individuals], json_file)
+                json.dump([individual.to_dict() for individual in individuals], json_file)
         else:
             raise ValueError('Invalid checkpointing method "{}". Choose "pickle" or "json".'.format(method))
 
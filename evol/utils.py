@@ -1,5 +1,9 @@
 from inspect import signature
-from typing import List, Callable, Union, Sequence, Any, Generator
+from math import log, log1p
+from operator import is_
+from random import random
+from typing import List, Callable, Collection, Hashable, Union, Sequence, Any, Generator, Iterator, Optional
+from weakref import WeakKeyDictionary
 
 from evol import Individual
 
@@ -39,6 +43,36 @@ def offspring_generator(parents: List[Individual],
             yield Individual(chromosome=combined)
 
 
+def batch_offspring(parents: List[Individual],
+                    parent_picker: Callable[..., Union[Individual, Sequence]],
+                    combiner: Callable[..., Sequence[Any]],
+                    n: int,
+                    **kwargs) -> List[Individual]:
+    """Create offspring with a single call to a vectorized combiner.
+
+    :param parents: List of parents.
+    :param parent_picker: Function that selects parents. Must accept a sequence of
+        individuals and must return a single individual or a sequence of individuals.
+        Must accept all kwargs passed (i.e. must be decorated by select_arguments).
+    :param combiner: Function that combines chromosomes in batch. Must accept a list
+        containing a tuple of parent chromosomes per child and return a sequence with
+        one child chromosome per tuple. Must accept all kwargs passed (i.e. must be
+        decorated by select_arguments).
+    :param n: Number of children to create.
+    :param kwargs: Arguments
+    :returns: Children
+    """
+    parent_chromosomes = []
+    for _ in range(n):
+        selected_parents = parent_picker(parents, **kwargs)
+        if isinstance(selected_parents, Individual):
+            parent_chromosomes.append((selected_parents.chromosome,))
+        else:
+            parent_chromosomes.append(tuple(individual.chromosome for individual in selected_parents))
+    children = combiner(parent_chromosomes, **kwargs) if parent_chromosomes else []
+    return [Individual(chromosome=child) for child in children]
+
+
 def select_arguments(func: Callable) -> Callable:
     """Decorate a function such that it accepts any keyworded arguments.
 
@@ -50,10 +84,102 @@ def select_arguments(func: Callable) -> Callable:
     :param func: Function to decorate.
     :return: Callable
     """
+    parameters = None
+
     def result(*args, **kwargs):
+        nonlocal parameters
         try:
             return func(*args, **kwargs)
         except TypeError:
-            return func(*args, **{k: v for k, v in kwargs.items() if k in signature(func).parameters})
+            if parameters is None:
+                parameters = _parameter_names(func)
+            return func(*args, **{k: v for k, v in kwargs.items() if k in parameters})
 
     return result
+
+
+# Parameters per function, which are forgotten once the function itself is garbage collected
+_function_parameters = WeakKeyDictionary()
+
+
+def _parameter_names(func: Callable) -> Collection[str]:
+    """Get the names of the parameters of a function, inspecting its signature only once per function."""
+    underlying = getattr(func, '__func__', func)  # Bound methods are created anew on every attribute access
+    try:
+        parameters = _function_parameters.get(underlying)
+    except TypeError:  # The function can not be weakly referenced or is not hashable
+        return signature(func).parameters
+    if parameters is None:
+        parameters = _function_parameters[underlying] = signature(underlying).parameters
+    if underlying is not func:  # The first parameter of a bound method is bound to __self__
+        return list(parameters)[1:]
+    return parameters
+
+
+def sample_indices(n: int, probability: float) -> Iterator[int]:
+    """Select indices from range(n), each with the given probability.
+
+    Rather than drawing a random number for every index, the gaps between
+    selected indices are drawn from a geometric distribution. This requires
+    only about n * probability random draws.
+
+    :param n: Number of indices to select from.
+    :param probability: Probability that any index is selected.
+    :return: Iterator of selected indices, in increasing order.
+    """
+    if probability >= 1:
+        yield from range(n)
+        return
+    if probability <= 0:
+        return
+    log_complement = log1p(-probability)  # Unlike log(1 - probability), not 0 for tiny probabilities
+    index = -1
+    while True:
+        index += 1 + int(log(1 - random()) / log_complement)
+        if index >= n:
+            return
+        yield index
+
+
+_VALUE_TYPES = frozenset({bool, int, float, complex, str, bytes, type(None)})
+
+
+def chromosome_key(chromosome: Any) -> Optional[Hashable]:
+    """Get a hashable key that identifies a chromosome by its value, e.g. for caching its fitness.
+
+    Numbers, strings and bytes are their own key, and so are tuples and
+    frozensets of those. Other tuples and lists are keyed by the keys of
+    their elements, and array-like chromosomes that offer `tobytes` (such as
+    numpy arrays) by their raw data, dtype and shape. Other chromosomes, such
+    as instances of custom classes, may be hashed by identity or change in
+    place, so they get no key. This is the default cache_key of a Population.
+
+    :param chromosome: Chromosome to get the key of.
+    :return: Hashable, or None if the chromosome can not be keyed by its value.
+    """
+    try:
+        return _value_key(chromosome)
+    except TypeError:
+        return None
+
+
+def _value_key(chromosome: Any) -> Hashable:
+    """Get the key of chromosome_key, or raise a TypeError if the chromosome can not be keyed by its value."""
+    chromosome_type = type(chromosome)
+    if chromosome_type in _VALUE_TYPES:
+        return chromosome
+    if chromosome_type is frozenset:
+        if all(_value_key(element) is element for element in chromosome):
+            return chromosome
+        raise TypeError('a frozenset chromosome can only be keyed if it is hashable by value')
+    if chromosome_type is tuple or chromosome_type is list:
+        # E.g. a list of routes, each of which is a list itself
+        keys = tuple(map(_value_key, chromosome))
+        if chromosome_type is tuple and all(map(is_, keys, chromosome)):
+            return chromosome
+        return chromosome_type, keys
+    tobytes = getattr(chromosome, 'tobytes', None)
+    dtype = getattr(chromosome, 'dtype', None)
+    if callable(tobytes) and not getattr(dtype, 'hasobject', False):  # Object arrays would give their pointers
+        return chromosome_type, '' if dtype is None else str(dtype), getattr(chromosome, 'shape', None), tobytes()
+    raise TypeError(f'a chromosome of type {chromosome_type.__name__} can not be keyed by its value')
@@ -1,3 +1,5 @@
+import pytest
+
 from evol.problems.functions import Rosenbrock, Sphere, Rastrigin
 
 
@@ -20,3 +22,9 @@ def test_rastrigin_optimality():
     assert problem.eval_function((0, 0)) == 0.0
     problem = Rastrigin(size=5)
     assert problem.eval_function((0, 0, 0, 0, 0)) == 0.0
+
+
+def test_values():
+    assert Sphere(size=3).eval_function([1, 2, 3]) == 14
+    assert Rosenbrock(size=3).eval_function([0, 1, 2]) == (100 + 1) + (100 * 1)
+    assert Rastrigin(size=2).eval_function([0.5, 1]) == pytest.approx(20 + (0.25 + 10) + (1 - 10))
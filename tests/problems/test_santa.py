@@ -44,6 +44,10 @@ def test_base_score_method(base_problem):
     assert base_problem.eval_function([[2, 1, 0]]) == pytest.approx(2*expected)
 
 
+def test_home_distances(adv_problem):
+    assert adv_problem.home_distances == [1, pytest.approx(math.sqrt(2)), 1]
+
+
 def test_sleight_gift_weights(adv_problem):
     expected = (2+7) + (2+2) + (2+1) + (2+0)
     assert adv_problem.eval_function([[0, 1, 2]]) == pytest.approx(expected)
@@ -42,3 +42,17 @@ def test_can_initialize_our_datasets():
     problem = TSPProblem.from_coordinates(united_states_capitols)
     for i in range(len(united_states_capitols)):
         assert problem.distance_matrix[i][i] == 0
+
+
+def test_distance_matrix_is_symmetric():
+    problem = TSPProblem.from_coordinates(united_states_capitols)
+    n = len(united_states_capitols)
+    assert all(problem.distance_matrix[i][j] == problem.distance_matrix[j][i] for i in range(n) for j in range(n))
+    expected = math.sqrt((32.361538 - 58.301935) ** 2 + (-86.279118 + 134.419740) ** 2)
+    assert problem.distance_matrix[0][1] == pytest.approx(expected)
+
+
+def test_distance_matrix_rows_are_compact():
+    problem = TSPProblem.from_coordinates([(0, 0), (0, 1), (1, 0)])
+    assert all(row.typecode == 'd' for row in problem.distance_matrix)
+    assert TSPProblem(distance_matrix=[[0, 1], [1, 0]]).eval_function([0, 1]) == 2
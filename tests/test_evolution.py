@@ -14,6 +14,17 @@ class TestEvolution:
         assert len(evo.chain) == 0  # original unchanged
         assert evo_step.chain == ['step']  # copy with extra step
 
+    def test_breed_name_by_position(self):
+        evo = Evolution().survive(n=5).breed(pick_random, lambda x, y: x + y, None, 'breed')
+        assert evo.chain[-1].name == 'breed'
+        assert len(Population(list(range(10)), eval_function=lambda x: x).evolve(evo)) == 10
+
+    def test_map_and_mutate_names_by_position(self):
+        evo = Evolution().map(lambda i: i, 'map').mutate(lambda x: x + 1, 1.0, False, 'mutate')
+        assert [step.name for step in evo] == ['map', 'mutate']
+        pop = Population(list(range(10)), eval_function=lambda x: x).evolve(evo)
+        assert list(pop.chromosomes) == list(range(1, 11))
+
     def test_repr(self):
         assert repr(Evolution()) == 'Evolution()'
         assert repr(Evolution().evaluate()) == 'Evolution(\n  EvaluationStep())'
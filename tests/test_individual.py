@@ -1,8 +1,15 @@
 from copy import copy
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+
+from pytest import mark
 
 from evol import Individual
 
 
+class SlottedIndividual(Individual):
+    __slots__ = ('origin',)
+
+
 class TestIndividual:
 
     def test_init(self):
@@ -21,6 +28,47 @@ class TestIndividual:
         copied_individual.mutate(lambda x: (2, 3))
         assert individual.chromosome == (1, 2)
 
+    def test_slots(self):
+        individual = Individual(chromosome=(1, 2))
+        assert not hasattr(individual, '__dict__')
+        assert individual.to_dict() == {'age': 0, 'chromosome': (1, 2), 'fitness': None, 'id': individual.id}
+
+    def test_subclass_attributes(self):
+        class TaggedIndividual(Individual):
+            pass
+
+        individual = TaggedIndividual(chromosome=(1, 2))
+        individual.origin = 'breed'
+        assert copy(individual).origin == 'breed'
+        assert copy(individual).chromosome == (1, 2)
+        assert individual.to_dict()['origin'] == 'breed'
+
+    def test_subclass_slots(self):
+        individual = SlottedIndividual(chromosome=(1, 2))
+        individual.origin = 'breed'
+        assert not hasattr(individual, '__dict__')
+        assert copy(individual).origin == 'breed'
+        assert copy(individual).chromosome == (1, 2)
+        assert individual.to_dict() == {'age': 0, 'chromosome': (1, 2), 'fitness': None, 'id': individual.id,
+                                        'origin': 'breed'}
+
+    @mark.parametrize('protocol', range(HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        individual = Individual(chromosome=(1, 2), fitness=3)
+        unpickled = loads(dumps(individual, protocol=protocol))
+        assert (unpickled.chromosome, unpickled.fitness, unpickled.id) == (individual.chromosome, 3, individual.id)
+
+    @mark.parametrize('protocol', range(HIGHEST_PROTOCOL + 1))
+    def test_pickle_subclass_slots(self, protocol):
+        individual = SlottedIndividual(chromosome=(1, 2), fitness=3)
+        individual.origin = 'breed'
+        assert loads(dumps(individual, protocol=protocol)).to_dict() == individual.to_dict()
+
+    def test_setstate_dictionary(self):
+        individual = Individual.__new__(Individual)
+        individual.__setstate__({'age': 1, 'chromosome': (1, 2), 'fitness': 3, 'id': 'abc'})
+        assert (individual.age, individual.chromosome, individual.fitness, individual.id) == (1, (1, 2), 3, 'abc')
+
     def test_evaluate(self):
         ind = Individual(chromosome=(1, 2))
         ind.evaluate(sum)
@@ -1,22 +1,43 @@
 from time import sleep, time
 
 import os
+from math import ceil
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import copy
-from pytest import raises, mark
+from pytest import approx, raises, mark
 from random import random, choices, seed
 
-from evol import Population, ContestPopulation
+from evol import Evolution, Individual, Population, ContestPopulation
 from evol.helpers.groups import group_duplicate, group_stratified
 from evol.helpers.pickers import pick_random
 from evol.population import Contest
 
 
+def score_chromosomes(*chromosomes):
+    """Score each chromosome by itself, defined at module level so that it can be pickled."""
+    return chromosomes[0] if len(chromosomes) == 1 else chromosomes
+
+
 class TestPopulationSimple:
 
     def test_filter_works(self, simple_chromosomes, simple_evaluation_function):
         pop = Population(chromosomes=simple_chromosomes, eval_function=simple_evaluation_function)
         assert len(pop.filter(func=lambda i: random() > 0.5)) < 200
 
+    def test_filter_kwargs(self, simple_chromosomes, simple_evaluation_function):
+        pop = Population(chromosomes=simple_chromosomes, eval_function=simple_evaluation_function)
+        pop.filter(func=lambda i, threshold: i.chromosome > threshold, threshold=10)
+        assert [i.chromosome for i in pop] == [c for c in simple_chromosomes if c > 10]
+
+    @mark.parametrize('threads', [1, 4])
+    def test_map_threads(self, simple_chromosomes, threads):
+        def func(individual, offset):
+            return Individual(chromosome=individual.chromosome + offset)
+        pop = Population(chromosomes=simple_chromosomes, eval_function=lambda x: x)
+        pop.map(func, threads=threads, offset=1)
+        assert [i.chromosome for i in pop] == [c + 1 for c in simple_chromosomes]
+
     def test_population_init(self, simple_chromosomes):
         pop = Population(simple_chromosomes, eval_function=lambda x: x)
         assert len(pop) == len(simple_chromosomes)
@@ -35,6 +56,15 @@ class TestPopulationSimple:
         assert not any_population.is_evaluated
         assert any_population.evaluate().is_evaluated
 
+    def test_is_evaluated_with_custom_equality(self):
+        class Fitness(float):
+            def __eq__(self, other):
+                raise TypeError('Fitness can not be compared with ==')
+
+        pop = Population(chromosomes=[1, 2], eval_function=Fitness)
+        assert not pop.is_evaluated
+        assert pop.evaluate().is_evaluated
+
 
 class TestPopulationCopy:
 
@@ -50,6 +80,15 @@ class TestPopulationCopy:
         assert evaluated_population.is_evaluated
         assert copied_population.is_evaluated
 
+    def test_population_copy_individuals(self, simple_population):
+        simple_population.evaluate()
+        copied_population = copy(simple_population)
+        assert copied_population.id == simple_population.id
+        for original, copied in zip(simple_population, copied_population):
+            assert copied is not original
+            assert copied.id == original.id
+            assert (copied.chromosome, copied.fitness) == (original.chromosome, original.fitness)
+
 
 class TestPopulationEvaluate:
 
@@ -102,6 +141,103 @@ class TestPopulationEvaluate:
         if self.cpus > 1:
             assert multi_proc_time < single_proc_time
 
+    def test_pool_is_created_lazily_and_shared(self, simple_chromosomes):
+        pop1 = Population(simple_chromosomes, eval_function=lambda x: x, concurrent_workers=2)
+        pop2 = Population(simple_chromosomes, eval_function=lambda x: x, concurrent_workers=2)
+        assert pop1._pool is None
+        assert pop1.pool is pop2.pool
+        assert all(group.pool is None for group in pop1.group(group_duplicate, n_groups=2))
+
+    def test_evaluate_map_function(self, any_population):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            any_population.map_function = executor.map
+            assert any_population.evaluate().is_evaluated
+
+    @mark.parametrize('population_class', [Population, ContestPopulation])
+    def test_map_function_replaces_pool(self, population_class):
+        evo = Evolution().evaluate().repeat(Evolution().survive(fraction=0.5).breed(pick_random, combiner=max),
+                                            grouping_function=group_duplicate, n_groups=2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pop = population_class(list(range(10)), eval_function=score_chromosomes, concurrent_workers=2,
+                                   map_function=executor.map)
+            assert pop.pool is None
+            assert len(pop.evolve(evo)) == 10
+            assert pop._pool is None
+
+    @mark.parametrize('population_class', [Population, ContestPopulation])
+    def test_evaluate_process_pool_executor(self, population_class):
+        pop = population_class([1, 2, 3, 4], eval_function=score_chromosomes)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pop.map_function = executor.map
+            assert pop.evaluate().is_evaluated
+
+    def test_evaluate_cache(self):
+        calls = []
+
+        def eval_function(x):
+            calls.append(x)
+            return sum(x)
+
+        pop = Population([[1, 2], [2, 1], [1, 2], [3, 3]], eval_function=eval_function, cache_size=2)
+        pop.evaluate()
+        assert [individual.fitness for individual in pop] == [3, 3, 3, 6]
+        assert calls == [[1, 2], [2, 1], [3, 3]]
+        pop.evaluate()  # [2, 1] and [3, 3] are cached, [1, 2] was evicted
+        assert calls == [[1, 2], [2, 1], [3, 3], [1, 2]]
+        pop.clear_cache().evaluate()
+        assert len(calls) == 7
+
+    def test_evaluate_cache_key(self):
+        calls = []
+
+        def eval_function(chromosome):
+            calls.append(chromosome)
+            return chromosome['x']
+
+        pop = Population([{'x': 1, 'name': 'a'}, {'x': 1, 'name': 'b'}, {'x': 2, 'name': 'c'}],
+                         eval_function=eval_function, cache_size=10, cache_key=itemgetter('x'))
+        pop.evaluate()
+        assert len(calls) == 2
+        assert [individual.fitness for individual in pop] == [1, 1, 2]
+        assert copy(pop).cache_key is pop.cache_key
+
+    def test_evaluate_cache_skips_chromosomes_without_value(self):
+        class Chromosome:
+            def __init__(self, value):
+                self.value = value
+
+            def __eq__(self, other):  # Without __hash__, so unhashable and keyed on repr before
+                return self.value == other.value
+
+        class Counter:  # Hashed by identity, and mutated in place
+            value = 0
+
+        pop = Population([Chromosome(i) for i in range(5)], eval_function=lambda c: c.value, cache_size=10)
+        for _ in range(200):
+            pop.mutate(lambda c: Chromosome(c.value + 1)).evaluate()
+            assert all(individual.fitness == individual.chromosome.value for individual in pop)
+
+        def increment(counter):
+            counter.value += 1
+            return counter
+
+        pop = Population([Counter()], eval_function=lambda c: c.value, cache_size=10)
+        assert pop.evaluate()[0].fitness == 0
+        assert pop.mutate(increment).evaluate()[0].fitness == 1
+
+    def test_evaluate_vectorized(self):
+        calls = []
+
+        def eval_function(chromosomes):
+            calls.append(list(chromosomes))
+            return [sum(chromosome) for chromosome in chromosomes]
+
+        pop = Population([[1, 2], [3, 4], [5, 6]], eval_function=eval_function, vectorized=True)
+        assert [individual.fitness for individual in pop.evaluate()] == [3, 7, 11]
+        pop.individuals[1].fitness = None
+        pop.evaluate(lazy=True).evaluate(lazy=True)
+        assert calls == [[[1, 2], [3, 4], [5, 6]], [[3, 4]]]
+
     def test_evaluate_lazy(self, any_population):
         pop = any_population
         pop.evaluate(lazy=True)  # should evaluate
@@ -142,6 +278,21 @@ class TestPopulationSurvive:
         assert len(pop2.survive(fraction=0.9, n=10)) == 10
         assert len(pop3.survive(fraction=0.5, n=190, luck=True)) == 100
 
+    @mark.parametrize('n', [1, 2, 10])
+    def test_survive_keeps_the_best(self, shuffled_chromosomes, n):
+        for maximize in (True, False):
+            pop = Population(chromosomes=shuffled_chromosomes, eval_function=lambda x: x, maximize=maximize)
+            expected = sorted(shuffled_chromosomes, reverse=maximize)[:n]
+            assert list(pop.survive(n=n).chromosomes) == expected
+
+    def test_survive_luck(self, simple_chromosomes):
+        pop = Population(chromosomes=simple_chromosomes, eval_function=lambda x: x).survive(n=50, luck=True)
+        assert len(pop) == 50
+        assert min(simple_chromosomes) not in pop.chromosomes  # The worst individual has weight zero
+        pop = Population(chromosomes=simple_chromosomes, eval_function=lambda x: 1).survive(n=50, luck=True)
+        assert len(pop) == 50
+        assert set(pop.chromosomes) <= set(simple_chromosomes)
+
     def test_breed_increases_generation(self, any_population):
         assert any_population.breed(parent_picker=pick_random, combiner=lambda mom, dad: mom).generation == 1
 
@@ -183,6 +334,36 @@ class TestPopulationBreed:
         assert len(pop2) == 400
         assert pop2.intended_size == 400
 
+    def test_breed_vectorized(self, simple_chromosomes, simple_evaluation_function):
+        def combiner(parents, offset=0):
+            assert isinstance(parents, list)
+            return [mom + dad + offset for mom, dad in parents]
+        pop = Population(chromosomes=simple_chromosomes, eval_function=simple_evaluation_function)
+        pop.survive(n=50).breed(parent_picker=pick_random, combiner=combiner, vectorized=True,
+                                population_size=120, n_parents=2, offset=0.5)
+        assert len(pop) == 120
+        assert all(chromosome % 1 == 0.5 for chromosome in list(pop.chromosomes)[50:])
+
+    @mark.parametrize('vectorized', [False, True])
+    def test_breed_only_picks_existing_parents(self, simple_population, vectorized):
+        n_parents = []
+
+        def parent_picker(parents):
+            n_parents.append(len(parents))
+            return pick_random(parents, n_parents=1)
+
+        combiner = (lambda parents: [chromosomes[0] for chromosomes in parents]) if vectorized else (lambda x: x)
+        simple_population.survive(n=10).breed(parent_picker=parent_picker, combiner=combiner, vectorized=vectorized)
+        assert len(simple_population) == 100
+        assert n_parents == [10] * 90
+
+    def test_breed_leaves_discarded_individuals_alone(self, simple_population):
+        worst = simple_population.evaluate().current_worst
+        chromosome, fitness = worst.chromosome, worst.fitness
+        simple_population.survive(fraction=0.5).breed(parent_picker=pick_random, combiner=lambda x, y: x + y)
+        assert (worst.chromosome, worst.fitness) == (chromosome, fitness)
+        assert all(individual is not worst for individual in simple_population)
+
     def test_breed_raises_with_multiple_values_for_kwarg(self, simple_population):
 
         (simple_population
@@ -241,6 +422,22 @@ class TestPopulationMutate:
         for chromosome in pop.chromosomes:
             assert chromosome == 17
 
+    def test_mutate_threads(self):
+        pop = Population(list(range(100)), eval_function=lambda x: x).evaluate()
+        pop.mutate(lambda x, y: x + y, threads=4, y=1)
+        assert list(pop.chromosomes) == list(range(1, 101))
+        assert not pop.is_evaluated
+
+    def test_mutate_vectorized(self):
+        def mutate_func(chromosomes, y=0):
+            assert isinstance(chromosomes, list)
+            return [x + y for x in chromosomes]
+        pop = Population([1]*100, eval_function=lambda x: x).evaluate()
+        pop.mutate(mutate_func, vectorized=True, y=16)
+        for individual in pop:
+            assert individual.chromosome == 17
+            assert individual.fitness is None
+
     def test_mutate_elitist(self):
         pop = Population([1, 1, 3], eval_function=lambda x: x).evaluate().mutate(lambda x: x + 1, elitist=True)
         for chromosome in pop.chromosomes:
@@ -264,6 +461,17 @@ class TestPopulationWeights:
             else:
                 assert pop._individual_weights[0] == 1
 
+    def test_cum_weights(self, simple_chromosomes):
+        for maximize in (False, True):
+            pop = Population(chromosomes=simple_chromosomes, eval_function=lambda x: x, maximize=maximize).evaluate()
+            weights = pop._individual_weights
+            cum_weights = pop._individual_cum_weights
+            span = max(simple_chromosomes) - min(simple_chromosomes)
+            assert len(cum_weights) == len(pop)
+            assert cum_weights[-1] == approx(sum(weights) * span)
+        pop = Population(chromosomes=simple_chromosomes, eval_function=lambda x: 1).evaluate()
+        assert pop._individual_cum_weights is None
+
 
 class TestPopulationBest:
 
@@ -307,6 +515,15 @@ class TestPopulationIslands:
         assert type(groups) == list
         assert all(type(group) is Population for group in groups)
 
+    def test_groups_copy_individuals(self, simple_population):
+        simple_population.evaluate()
+        groups = simple_population.group(group_duplicate, n_groups=2)
+        for group in groups:
+            assert group.is_evaluated
+            assert not any(individual in simple_population.individuals for individual in group)
+        groups[0].mutate(lambda x: x + 1000)
+        assert all(abs(chromosome) < 1000 for chromosome in groups[1].chromosomes)
+
     def test_no_groups(self, simple_population):
         with raises(ValueError):
             simple_population.group(group_duplicate, n_groups=0)
@@ -339,6 +556,22 @@ class TestPopulationIslands:
         combined = Population.combine(*groups)
         assert combined.intended_size == simple_population.intended_size
 
+    def test_combine_keeps_fitness(self, simple_chromosomes):
+        calls = []
+        pop = Population(simple_chromosomes, eval_function=lambda x: calls.append(x) or x).evaluate()
+        groups = pop.group(group_stratified, n_groups=3)
+        combined = Population.combine(*groups, intended_size=10)
+        assert len(calls) == len(simple_chromosomes)
+        assert sorted(combined.chromosomes) == simple_chromosomes[-10:]
+
+    def test_combine_copies_first_island(self, simple_population):
+        groups = simple_population.evaluate().group(group_stratified, n_groups=2)
+        chromosomes = list(groups[0].chromosomes)
+        combined = Population.combine(*groups)
+        assert not any(individual in groups[0].individuals for individual in combined)
+        combined.survive(n=5).mutate(lambda x: None)
+        assert list(groups[0].chromosomes) == chromosomes
+
     def test_combine_nothing(self):
         with raises(ValueError):
             Population.combine()
@@ -374,6 +607,15 @@ class TestContestPopulation:
         assert cp.contests_per_round == 15
         assert cp.individuals_per_contest == 15
 
+    @mark.parametrize('individuals_per_contest,contests_per_round', [(2, 1), (3, 5), (4, 4)])
+    def test_scores_go_to_the_competitors(self, individuals_per_contest, contests_per_round):
+        # Each competitor scores its own chromosome, so the fitness is the chromosome times the number of contests
+        pop = ContestPopulation(list(range(1, 20)), eval_function=lambda *chromosomes: chromosomes,
+                                individuals_per_contest=individuals_per_contest, contests_per_round=contests_per_round)
+        n_contests = ceil(contests_per_round / individuals_per_contest) * individuals_per_contest
+        for individual in pop.evaluate():
+            assert individual.fitness == individual.chromosome * n_contests
+
 
 class TestContestPopulationBest:
 
@@ -32,7 +32,7 @@ class TestPickleCheckpoint:
         simple_population.checkpoint(target=directory, method=self.method)
         pop = Population.load(directory, lambda x: x['x'])
         assert len(simple_population) == len(pop)
-        assert all(x.__dict__ == y.__dict__ for x, y in zip(simple_population, pop))
+        assert all(x.to_dict() == y.to_dict() for x, y in zip(simple_population, pop))
 
     def test_load_invalid_target(self, tmpdir):
         directory = tmpdir.mkdir('ckpt')
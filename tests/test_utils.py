@@ -1,8 +1,13 @@
+from gc import collect
+from inspect import signature
+from random import seed
+from weakref import ref
+
 from pytest import mark
 
 from evol import Population, Individual
 from evol.helpers.pickers import pick_random
-from evol.utils import offspring_generator, select_arguments
+from evol.utils import _parameter_names, chromosome_key, offspring_generator, sample_indices, select_arguments
 
 
 class TestOffspringGenerator:
@@ -72,3 +77,110 @@ class TestSelectArguments:
         def fct(a, b=0, **kwargs):
             return a + b + sum(kwargs.values())
         assert fct(*args, **kwargs) == result
+
+
+class TestParameterNames:
+
+    def test_inspects_signature_once(self, monkeypatch):
+        calls = []
+
+        def counting_signature(func):
+            calls.append(func)
+            return signature(func)
+
+        def fct(a, b=0):
+            return a + b
+        monkeypatch.setattr('evol.utils.signature', counting_signature)
+        assert select_arguments(fct)(1, b=2, c=3) == 3
+        assert select_arguments(fct)(1, b=2, c=3) == 3
+        assert calls == [fct]
+
+    def test_bound_method(self):
+        class Adder:
+            def add(self, a, b=0):
+                return a + b
+        assert list(_parameter_names(Adder().add)) == ['a', 'b']
+        assert list(_parameter_names(Adder.add)) == ['self', 'a', 'b']
+        assert select_arguments(Adder().add)(1, b=2, self=3) == 3
+
+    def test_unhashable_function(self):
+        class Adder:
+            __hash__ = None
+
+            def __call__(self, a, b=0):
+                return a + b
+        assert select_arguments(Adder())(1, b=2, c=3) == 3
+
+    def test_function_is_not_kept_alive(self):
+        def fct(a, b=0):
+            return a + b
+        assert select_arguments(fct)(1, b=2, c=3) == 3
+        reference = ref(fct)
+        del fct
+        collect()
+        assert reference() is None
+
+
+class TestSampleIndices:
+
+    @mark.parametrize('probability,expected', [
+        (0, []), (-1, []), (1e-17, []), (1, list(range(10))), (2, list(range(10)))
+    ])
+    def test_edge_cases(self, probability, expected):
+        assert list(sample_indices(10, probability=probability)) == expected
+
+    def test_fraction(self):
+        seed(0)
+        indices = list(sample_indices(10000, probability=0.2))
+        assert indices == sorted(set(indices))
+        assert all(0 <= index < 10000 for index in indices)
+        assert 1800 < len(indices) < 2200
+
+
+class TestChromosomeKey:
+
+    @mark.parametrize('chromosome', [1, 'abc', (1, 2), frozenset({3})])
+    def test_hashable(self, chromosome):
+        assert chromosome_key(chromosome) is chromosome
+
+    def test_unhashable(self):
+        assert chromosome_key([1, 2]) == chromosome_key([1, 2])
+        assert chromosome_key([1, 2]) != chromosome_key([2, 1])
+        assert chromosome_key({'a': [1]}) != chromosome_key([1])
+
+    def test_no_key(self):
+        class Chromosome:
+            def __eq__(self, other):
+                return True
+
+        class Plain:
+            pass
+
+        for chromosome in (Chromosome(), Plain(), (1, Plain()), frozenset({Plain()}), [Plain()], {'a': 1}):
+            assert chromosome_key(chromosome) is None
+
+    def test_list_is_not_its_tuple(self):
+        assert chromosome_key([1, 2]) != chromosome_key((1, 2))
+        assert chromosome_key([[1], [2]]) == chromosome_key([[1], [2]])
+
+    def test_tuple_of_lists(self):
+        key = chromosome_key(([0, 1], [2]))
+        assert key == chromosome_key(([0, 1], [2]))
+        assert key != chromosome_key(([0], [1, 2]))
+        assert key != chromosome_key([[0, 1], [2]])
+
+    def test_nested_lists(self):
+        key = chromosome_key([[0, 1], [2]])
+        assert hash(key) == hash(chromosome_key([[0, 1], [2]]))
+        assert key != chromosome_key([[0], [1, 2]])
+        assert isinstance(key[1][0], tuple)
+
+    def test_tobytes(self):
+        class Array(list):
+            dtype = 'int8'
+
+            def tobytes(self):
+                return bytes(self)
+
+        assert chromosome_key(Array([1, 2])) == chromosome_key(Array([1, 2]))
+        assert chromosome_key(Array([1, 2])) != chromosome_key(Array([2, 1]))